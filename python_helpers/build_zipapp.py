@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Build Script - Bundles the font manager helper into a single zipapp
+The archive carries the source plus bytecode compiled with -OO, so each short-lived
+invocation imports from one zip read instead of compiling the script
+"""
+
+import os
+import sys
+import shutil
+import zipapp
+import tempfile
+import py_compile
+
+HELPERS_DIR = os.path.dirname(os.path.abspath(__file__))
+SOURCE_PATH = os.path.join(HELPERS_DIR, 'font_manager.py')
+DEFAULT_OUTPUT = os.path.join(HELPERS_DIR, 'fontmgr.pyz')
+
+def build(output_path=DEFAULT_OUTPUT):
+    """
+    Build the zipapp bundle
+    Args:
+        output_path: Where to write the .pyz archive
+    Returns:
+        str: Path of the written archive
+    """
+    with tempfile.TemporaryDirectory() as staging_dir:
+        staged_source = os.path.join(staging_dir, 'font_manager.py')
+        shutil.copy2(SOURCE_PATH, staged_source)
+        
+        # zipimport only looks for bytecode next to the source, not in __pycache__.
+        # The .pyc is tied to this interpreter version; other versions fall back
+        # to the bundled source
+        py_compile.compile(staged_source,
+                           cfile=os.path.join(staging_dir, 'font_manager.pyc'),
+                           optimize=2,
+                           doraise=True)
+        
+        zipapp.create_archive(staging_dir, output_path,
+                              interpreter='/usr/bin/env python3',
+                              main='font_manager:main')
+    
+    return output_path
+
+def main():
+    """Main CLI function"""
+    output_path = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_OUTPUT
+    print(f"Built {build(output_path)}")
+
+if __name__ == '__main__':
+    main()
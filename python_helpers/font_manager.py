@@ -7,23 +7,116 @@ This script provides cross-platform functionality to install and uninstall fonts
 import os
 import sys
 import json
-import shutil
+import errno
 import platform
-import subprocess
-from pathlib import Path
+import functools
+import contextlib
 
+if sys.platform == 'win32':
+    import msvcrt
+    import winreg
+else:
+    import fcntl
+
+# ctypes, subprocess, shutil, threading and concurrent.futures are imported
+# inside the functions that use them, so commands such as `list` never load them
+
+# Win32 constants used to register fonts without spawning PowerShell
+FONTS_REG_PATH = r'Software\Microsoft\Windows NT\CurrentVersion\Fonts'
+HWND_BROADCAST = 0xFFFF
+WM_FONTCHANGE = 0x001D
+SMTO_ABORTIFHUNG = 0x0002
+
+# Resolved once at import; the host OS cannot change while the script runs
+_SYSTEM = platform.system()
+_HOME = os.path.expanduser('~')
+
+# Set FONTMANAGER_VERBOSE to report per-font failures on stderr
+_VERBOSE = bool(os.environ.get('FONTMANAGER_VERBOSE'))
+
+# Set FONTMANAGER_DEMO to list sample fonts when the user has none installed
+_DEMO = bool(os.environ.get('FONTMANAGER_DEMO'))
+
+# Per-platform settings for the POSIX copy-and-refresh activators
+_PLATFORM_OPS = {
+    'Linux': {'name': 'Linux', 'cache_refresh': ['fc-cache', '-f'], 'stamp': 'fc_stamp'},
+    'Darwin': {'name': 'macOS', 'cache_refresh': ['atsutil', 'databases', '-remove'],
+               'stamp': 'atsutil_stamp'},
+}
+
+# Holds stamp files recording the fonts directory state at the last cache refresh
+_CACHE_DIR = os.path.join(_HOME, '.cache', 'fontmanagerx')
+_LOCK_PATH = os.path.join(_CACHE_DIR, 'install.lock')
+
+# File extensions recognised as fonts when listing a directory
+_FONT_EXTS = frozenset({'ttf', 'otf', 'woff', 'woff2'})
+
+# Buffer size for the userland copy fallback; most font files fit in one read
+COPY_BUFSIZE = 1024 * 1024
+
+# copyfile(3) flag on macOS: copy data, stat info, ACLs and xattrs
+COPYFILE_ALL = 0x000F
+
+@functools.lru_cache(maxsize=1)
 def get_user_fonts_directory():
     """Get the user fonts directory based on the operating system"""
-    system = platform.system()
-    
-    if system == 'Windows':
+    if _SYSTEM == 'Windows':
         return os.path.join(os.environ.get('WINDIR', 'C:\\Windows'), 'Fonts')
-    elif system == 'Darwin':  # macOS
-        return os.path.join(os.path.expanduser('~'), 'Library/Fonts')
-    elif system == 'Linux':
-        return os.path.join(os.path.expanduser('~'), '.local/share/fonts')
+    elif _SYSTEM == 'Darwin':  # macOS
+        return os.path.join(_HOME, 'Library/Fonts')
+    elif _SYSTEM == 'Linux':
+        return os.path.join(_HOME, '.local/share/fonts')
     else:
-        return os.path.join(os.path.expanduser('~'), 'fonts')
+        return os.path.join(_HOME, 'fonts')
+
+_USER_FONTS_DIR = get_user_fonts_directory()
+
+def _fast_copy(src, dst):
+    """
+    Copy a font file using the platform's in-kernel copy primitive
+    Falls back to a buffered userland copy where that primitive is unavailable
+    """
+    if _SYSTEM in ('Windows', 'Darwin'):
+        import ctypes
+    
+    if _SYSTEM == 'Windows':
+        if not ctypes.windll.kernel32.CopyFileW(src, dst, False):
+            raise ctypes.WinError()
+        return
+    
+    if _SYSTEM == 'Darwin':
+        libc = ctypes.CDLL('libc.dylib', use_errno=True)
+        if libc.copyfile(os.fsencode(src), os.fsencode(dst), None, COPYFILE_ALL) != 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err), src)
+        return
+    
+    if hasattr(os, 'sendfile'):
+        with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+            src_fd = fsrc.fileno()
+            dst_fd = fdst.fileno()
+            size = os.fstat(src_fd).st_size
+            offset = 0
+            try:
+                while offset < size:
+                    sent = os.sendfile(dst_fd, src_fd, offset, size - offset)
+                    if sent == 0:
+                        break
+                    offset += sent
+                return
+            except OSError:
+                # Filesystem does not support sendfile, use the userland copy
+                if offset != 0:
+                    raise
+    
+    _buffered_copy(src, dst)
+
+def _buffered_copy(src, dst):
+    """Copy a font through a userland buffer sized for large font collections"""
+    import shutil
+    
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        shutil.copyfileobj(fsrc, fdst, length=COPY_BUFSIZE)
 
 def activate_font(font_path):
     """
@@ -33,21 +126,14 @@ def activate_font(font_path):
     Returns:
         bool: Success status
     """
-    system = platform.system()
-    
-    try:
-        if system == 'Windows':
-            return activate_font_windows(font_path)
-        elif system == 'Darwin':  # macOS
-            return activate_font_macos(font_path)
-        elif system == 'Linux':
-            return activate_font_linux(font_path)
-        else:
-            print(f"Unsupported operating system: {system}")
-            return False
-    except Exception as e:
-        print(f"Error activating font: {e}")
+    activator = _ACTIVATORS.get(_SYSTEM)
+    if activator is None:
+        if _VERBOSE:
+            print(f"Unsupported operating system: {_SYSTEM}", file=sys.stderr)
         return False
+    
+    # The platform handlers catch and report their own failures
+    return activator(font_path)
 
 def deactivate_font(font_path):
     """
@@ -57,175 +143,399 @@ def deactivate_font(font_path):
     Returns:
         bool: Success status
     """
-    system = platform.system()
-    
-    try:
-        if system == 'Windows':
-            return deactivate_font_windows(font_path)
-        elif system == 'Darwin':  # macOS
-            return deactivate_font_macos(font_path)
-        elif system == 'Linux':
-            return deactivate_font_linux(font_path)
-        else:
-            print(f"Unsupported operating system: {system}")
-            return False
-    except Exception as e:
-        print(f"Error deactivating font: {e}")
+    deactivator = _DEACTIVATORS.get(_SYSTEM)
+    if deactivator is None:
+        if _VERBOSE:
+            print(f"Unsupported operating system: {_SYSTEM}", file=sys.stderr)
         return False
+    
+    # The platform handlers catch and report their own failures
+    return deactivator(font_path)
 
-def activate_font_windows(font_path):
+def activate_fonts(font_paths):
     """
-    Install a font on Windows
-    Uses the system font API through PowerShell
+    Installs several fonts and refreshes the font cache once at the end
+    Font files are copied in parallel; registration and the cache refresh
+    run on the calling thread
+    Args:
+        font_paths: List of paths to font files
+    Returns:
+        tuple: Success status keyed by font path, and a list of error records
     """
-    try:
-        # Create a PowerShell command to add the font
-        font_file = os.path.basename(font_path)
-        user_fonts_dir = get_user_fonts_directory()
-        
-        # Copy the font to the Fonts directory
-        dest_path = os.path.join(user_fonts_dir, font_file)
-        
-        if not os.path.exists(dest_path):
-            shutil.copy2(font_path, dest_path)
+    from concurrent.futures import ThreadPoolExecutor
+    
+    if _SYSTEM not in _ACTIVATORS:
+        error = {'font_path': None, 'error': f"Unsupported operating system: {_SYSTEM}"}
+        return {font_path: False for font_path in font_paths}, [error]
+    
+    # Create the destination once up front instead of racing in each worker
+    user_fonts_dir = _USER_FONTS_DIR
+    os.makedirs(user_fonts_dir, exist_ok=True)
+    
+    pairs = [(font_path, os.path.join(user_fonts_dir, os.path.basename(font_path)))
+             for font_path in font_paths]
+    
+    def copy_pair(pair):
+        # ValueError covers unusable paths such as ones with embedded NULs
+        try:
+            return copy_font_file(*pair), None
+        except (OSError, ValueError) as e:
+            return False, e
+    
+    max_workers = min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        copies = list(executor.map(copy_pair, pairs))
+    
+    results = {}
+    errors = []
+    for font_path, (_, error) in zip(font_paths, copies):
+        results[font_path] = error is None
+        if error is not None:
+            errors.append({'font_path': font_path, 'error': str(error)})
+    
+    if _SYSTEM == 'Windows':
+        with _install_lock():
+            for (font_path, dest_path), (copied, _) in zip(pairs, copies):
+                if not results[font_path]:
+                    continue
+                try:
+                    register_font_windows(dest_path, copied)
+                except (OSError, ValueError) as e:
+                    results[font_path] = False
+                    errors.append({'font_path': font_path, 'error': str(e)})
+    
+    # A single cache refresh covers every font copied above
+    if any(results.values()):
+        try:
+            refresh_font_cache()
+        except OSError as e:
+            results = {font_path: False for font_path in results}
+            errors.append({'font_path': None, 'error': f"Error refreshing font cache: {e}"})
+    
+    return results, errors
+
+def refresh_font_cache():
+    """Rebuild the font cache so newly installed or removed fonts are picked up"""
+    if _SYSTEM == 'Windows':
+        broadcast_font_change()
+    elif _SYSTEM in _PLATFORM_OPS:
+        _maybe_refresh_cache(_PLATFORM_OPS[_SYSTEM])
+
+def _maybe_refresh_cache(ops):
+    """
+    Run the platform cache refresh unless the fonts directory is unchanged
+    The directory mtime seen at the last successful refresh is kept in a stamp file
+    Raises:
+        OSError: If the refresh command is missing or fails
+    """
+    import subprocess
+    
+    stamp_path = os.path.join(_CACHE_DIR, ops['stamp'])
+    
+    with _install_lock():
+        try:
+            mtime = str(os.stat(_USER_FONTS_DIR).st_mtime_ns)
+        except FileNotFoundError:
+            mtime = None
         
-        # Use PowerShell to install the font through the Shell API
-        ps_command = f"""
-        $objShell = New-Object -ComObject Shell.Application
-        $objFolder = $objShell.Namespace(0x14)
-        $objFolder.CopyHere("{dest_path}")
-        """
+        if mtime is not None:
+            try:
+                with open(stamp_path, encoding='utf-8') as f:
+                    if f.read().strip() == mtime:
+                        return
+            except OSError:
+                pass
         
-        # Execute PowerShell command
-        subprocess.run(['powershell', '-Command', ps_command], 
-                      check=True, 
-                      capture_output=True)
+        try:
+            subprocess.run(ops['cache_refresh'], 
+                          check=True, 
+                          stdout=subprocess.DEVNULL, 
+                          stderr=subprocess.DEVNULL)
+        except subprocess.CalledProcessError as e:
+            # Surface as OSError so callers need not import subprocess
+            raise OSError(f"{' '.join(e.cmd)} exited with status {e.returncode}") from e
         
-        return True
-    except Exception as e:
-        print(f"Error activating font on Windows: {e}")
-        return False
+        if mtime is not None:
+            with open(stamp_path, 'w', encoding='utf-8') as f:
+                f.write(mtime)
 
-def deactivate_font_windows(font_path):
+@contextlib.contextmanager
+def _install_lock():
     """
-    Uninstall a font on Windows
-    Removes from user fonts directory and updates registry
+    Hold an exclusive advisory lock shared by every font manager process
+    Serialises registry writes and cache refreshes; file copies run unlocked
+    """
+    os.makedirs(_CACHE_DIR, exist_ok=True)
+    with open(_LOCK_PATH, 'a+b') as lock_file:
+        fd = lock_file.fileno()
+        if _SYSTEM == 'Windows':
+            # LK_LOCK gives up with EDEADLOCK after ten one-second retries, so
+            # keep waiting on that; any other failure is real and is raised
+            lock_file.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+                    break
+                except OSError as e:
+                    if e.errno != errno.EDEADLOCK:
+                        raise
+            try:
+                yield
+            finally:
+                lock_file.seek(0)
+                msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+        else:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+
+def copy_font_file(font_path, dest_path):
+    """
+    Copy a font into place atomically, replacing any existing copy
+    The data is written to a private temporary name and then renamed over
+    the destination, so readers never see a partially written font.
+    An identical installed copy is left untouched so the fonts directory
+    mtime, which gates the cache refresh, does not change
+    Returns:
+        bool: True if a file was written, False if the font was already in place
     """
+    import threading
+    
     try:
-        font_file = os.path.basename(font_path)
-        user_fonts_dir = get_user_fonts_directory()
-        
-        # Path to the font in the Fonts directory
-        dest_path = os.path.join(user_fonts_dir, font_file)
+        src_stat = os.stat(font_path)
+        if _is_same_font(src_stat, dest_path):
+            return False
         
-        # Check if the font exists in the Fonts directory
-        if os.path.exists(dest_path):
-            # Use PowerShell to properly uninstall the font
-            ps_command = f"""
-            Remove-ItemProperty -Path "HKCU:\\SOFTWARE\\Microsoft\\Windows NT\\CurrentVersion\\Fonts" -Name "{font_file}"
-            Remove-Item -Path "{dest_path}" -Force
-            """
+        tmp_path = f"{dest_path}.tmp.{os.getpid()}.{threading.get_ident()}"
+        try:
+            if _SYSTEM == 'Windows':
+                _fast_copy(font_path, tmp_path)
+            else:
+                _link_or_copy(font_path, tmp_path)
             
-            # Execute PowerShell command
-            subprocess.run(['powershell', '-Command', ps_command], 
-                          check=True, 
-                          capture_output=True)
-        
-        return True
-    except Exception as e:
-        print(f"Error deactivating font on Windows: {e}")
+            # Carry the source mtime over so the next run can recognise the copy
+            if not os.path.samestat(src_stat, os.stat(tmp_path)):
+                os.utime(tmp_path, ns=(src_stat.st_atime_ns, src_stat.st_mtime_ns))
+            
+            # Windows refuses to replace a font GDI still has loaded; that
+            # PermissionError is reported so the old font is not mistaken
+            # for the new one
+            os.replace(tmp_path, dest_path)
+            return True
+        finally:
+            # Left behind after a failure, or when rename(2) found both names
+            # already linked to the same file
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(tmp_path)
+    except OSError as e:
+        # Report the real destination rather than the temporary name
+        raise OSError(e.errno, e.strerror, font_path,
+                      getattr(e, 'winerror', None), dest_path) from e
+
+def _is_same_font(src_stat, dest_path):
+    """Check whether dest_path already holds the font described by src_stat"""
+    try:
+        dest_stat = os.stat(dest_path)
+    except FileNotFoundError:
         return False
+    
+    # Either a hardlink to the source or a copy made with its mtime preserved
+    return (os.path.samestat(src_stat, dest_stat)
+            or (src_stat.st_size == dest_stat.st_size
+                and src_stat.st_mtime_ns == dest_stat.st_mtime_ns))
 
-def activate_font_macos(font_path):
+def _link_or_copy(src, dst):
     """
-    Install a font on macOS
-    Copies to user font directory and updates font cache
+    Hardlink a font into place, copying only when a link is not possible
+    A link is a metadata-only operation when both paths share a filesystem
     """
     try:
-        font_file = os.path.basename(font_path)
-        user_fonts_dir = get_user_fonts_directory()
-        
-        # Ensure user fonts directory exists
-        os.makedirs(user_fonts_dir, exist_ok=True)
-        
-        # Copy the font to the user fonts directory
-        dest_path = os.path.join(user_fonts_dir, font_file)
-        
-        if not os.path.exists(dest_path):
-            shutil.copy2(font_path, dest_path)
-        
-        # Update font cache
-        subprocess.run(['atsutil', 'databases', '-remove'], 
-                      check=True, 
-                      capture_output=True)
+        os.link(src, dst)
+    except OSError as e:
+        # EXDEV for cross-device paths; some filesystems refuse links outright
+        if e.errno not in (errno.EXDEV, errno.EPERM, errno.EMLINK, errno.ENOTSUP):
+            raise
+        _fast_copy(src, dst)
+
+def install_font_file(font_path):
+    """
+    Copy a font into the user fonts directory without refreshing the font cache
+    Returns:
+        str: Path of the installed copy
+    """
+    font_file = os.path.basename(font_path)
+    user_fonts_dir = _USER_FONTS_DIR
+    
+    # Ensure user fonts directory exists
+    os.makedirs(user_fonts_dir, exist_ok=True)
+    
+    # Copy the font to the user fonts directory
+    dest_path = os.path.join(user_fonts_dir, font_file)
+    copy_font_file(font_path, dest_path)
+    
+    return dest_path
+
+def broadcast_font_change():
+    """
+    Notify running applications that the set of installed fonts changed
+    Uses a timeout so a hung window cannot block the caller
+    """
+    import ctypes
+    
+    # lpdwResult is a PDWORD_PTR, which is pointer-sized on 64-bit Windows
+    result = ctypes.c_size_t()
+    ctypes.windll.user32.SendMessageTimeoutW(HWND_BROADCAST, WM_FONTCHANGE, 0, 0,
+                                             SMTO_ABORTIFHUNG, 1000,
+                                             ctypes.byref(result))
+
+def _registered_font_path(font_file):
+    """Return the path the per-user registry holds for a font, or None"""
+    try:
+        with winreg.OpenKey(winreg.HKEY_CURRENT_USER, FONTS_REG_PATH) as key:
+            value, _ = winreg.QueryValueEx(key, font_file)
+    except FileNotFoundError:
+        return None
+    return value
+
+def register_font_windows(dest_path, copied=True):
+    """
+    Load an installed font into the session and record it in the registry
+    GDI reference-counts AddFontResourceW, so a font that was already in
+    place and registered is left alone; loading it again would need a
+    matching number of RemoveFontResourceW calls to release the file
+    Args:
+        dest_path: Path of the installed font
+        copied: Whether the font file was just written
+    """
+    import ctypes
+    
+    font_file = os.path.basename(dest_path)
+    
+    if not copied and _registered_font_path(font_file) == dest_path:
+        return
+    
+    # Load the font into the current session
+    if not ctypes.windll.gdi32.AddFontResourceW(ctypes.c_wchar_p(dest_path)):
+        raise ctypes.WinError()
+    
+    # Register the font so it persists across sessions
+    with winreg.OpenKey(winreg.HKEY_CURRENT_USER, FONTS_REG_PATH, 0,
+                        winreg.KEY_SET_VALUE) as key:
+        winreg.SetValueEx(key, font_file, 0, winreg.REG_SZ, dest_path)
+
+def install_font_windows(font_path):
+    """
+    Copy and register a font on Windows without broadcasting the change
+    Returns:
+        str: Path of the installed copy
+    """
+    font_file = os.path.basename(font_path)
+    user_fonts_dir = _USER_FONTS_DIR
+    
+    # Copy the font to the Fonts directory
+    dest_path = os.path.join(user_fonts_dir, font_file)
+    copied = copy_font_file(font_path, dest_path)
+    
+    with _install_lock():
+        register_font_windows(dest_path, copied)
+    
+    return dest_path
+
+def activate_font_windows(font_path):
+    """
+    Install a font on Windows
+    Registers the font in-process through GDI and the per-user registry
+    """
+    try:
+        install_font_windows(font_path)
+        broadcast_font_change()
         
         return True
-    except Exception as e:
-        print(f"Error activating font on macOS: {e}")
+    except OSError as e:
+        if _VERBOSE:
+            print(f"Error activating font on Windows: {e}", file=sys.stderr)
         return False
 
-def deactivate_font_macos(font_path):
+def unregister_font_windows(dest_path):
     """
-    Uninstall a font on macOS
-    Removes from user font directory and updates font cache
+    Unload a font, delete its file and then drop its registry entry
+    The registry entry is only removed once the file is gone, so a font whose
+    file cannot be deleted stays registered and is loaded again
+    """
+    import ctypes
+    
+    font_file = os.path.basename(dest_path)
+    
+    if os.path.exists(dest_path):
+        # Release GDI's handle so the file can be deleted
+        ctypes.windll.gdi32.RemoveFontResourceW(ctypes.c_wchar_p(dest_path))
+        
+        try:
+            os.remove(dest_path)
+        except OSError:
+            # Leave the font usable, matching its registry entry
+            ctypes.windll.gdi32.AddFontResourceW(ctypes.c_wchar_p(dest_path))
+            raise
+    
+    # Fonts that were never registered are tolerated
+    try:
+        with winreg.OpenKey(winreg.HKEY_CURRENT_USER, FONTS_REG_PATH, 0,
+                            winreg.KEY_SET_VALUE) as key:
+            winreg.DeleteValue(key, font_file)
+    except FileNotFoundError:
+        pass
+
+def deactivate_font_windows(font_path):
+    """
+    Uninstall a font on Windows
+    Removes from user fonts directory and updates registry without a subprocess
     """
     try:
         font_file = os.path.basename(font_path)
-        user_fonts_dir = get_user_fonts_directory()
+        user_fonts_dir = _USER_FONTS_DIR
         
-        # Path to the font in the user fonts directory
+        # Path to the font in the Fonts directory
         dest_path = os.path.join(user_fonts_dir, font_file)
         
-        # Check if the font exists in the user fonts directory
-        if os.path.exists(dest_path):
-            os.remove(dest_path)
+        # Also clears the registration when the file was already deleted by hand
+        with _install_lock():
+            unregister_font_windows(dest_path)
         
-        # Update font cache
-        subprocess.run(['atsutil', 'databases', '-remove'], 
-                      check=True, 
-                      capture_output=True)
+        broadcast_font_change()
         
         return True
-    except Exception as e:
-        print(f"Error deactivating font on macOS: {e}")
+    except OSError as e:
+        if _VERBOSE:
+            print(f"Error deactivating font on Windows: {e}", file=sys.stderr)
         return False
 
-def activate_font_linux(font_path):
+def _activate_posix(font_path, ops):
     """
-    Install a font on Linux
+    Install a font on macOS or Linux
     Copies to user font directory and updates font cache
     """
     try:
-        font_file = os.path.basename(font_path)
-        user_fonts_dir = get_user_fonts_directory()
-        
-        # Ensure user fonts directory exists
-        os.makedirs(user_fonts_dir, exist_ok=True)
-        
-        # Copy the font to the user fonts directory
-        dest_path = os.path.join(user_fonts_dir, font_file)
-        
-        if not os.path.exists(dest_path):
-            shutil.copy2(font_path, dest_path)
+        install_font_file(font_path)
         
         # Update font cache
-        subprocess.run(['fc-cache', '-f'], 
-                      check=True, 
-                      capture_output=True)
+        _maybe_refresh_cache(ops)
         
         return True
-    except Exception as e:
-        print(f"Error activating font on Linux: {e}")
+    except OSError as e:
+        if _VERBOSE:
+            print(f"Error activating font on {ops['name']}: {e}", file=sys.stderr)
         return False
 
-def deactivate_font_linux(font_path):
+def _deactivate_posix(font_path, ops):
     """
-    Uninstall a font on Linux
+    Uninstall a font on macOS or Linux
     Removes from user font directory and updates font cache
     """
     try:
         font_file = os.path.basename(font_path)
-        user_fonts_dir = get_user_fonts_directory()
+        user_fonts_dir = _USER_FONTS_DIR
         
         # Path to the font in the user fonts directory
         dest_path = os.path.join(user_fonts_dir, font_file)
@@ -235,92 +545,184 @@ def deactivate_font_linux(font_path):
             os.remove(dest_path)
         
         # Update font cache
-        subprocess.run(['fc-cache', '-f'], 
-                      check=True, 
-                      capture_output=True)
+        _maybe_refresh_cache(ops)
         
         return True
-    except Exception as e:
-        print(f"Error deactivating font on Linux: {e}")
+    except OSError as e:
+        if _VERBOSE:
+            print(f"Error deactivating font on {ops['name']}: {e}", file=sys.stderr)
         return False
 
+_ACTIVATORS = {'Windows': activate_font_windows}
+_DEACTIVATORS = {'Windows': deactivate_font_windows}
+for _name, _ops in _PLATFORM_OPS.items():
+    _ACTIVATORS[_name] = functools.partial(_activate_posix, ops=_ops)
+    _DEACTIVATORS[_name] = functools.partial(_deactivate_posix, ops=_ops)
+
 def list_installed_fonts():
     """
     List all fonts installed on the system
     Returns:
         list: List of font paths
     """
-    user_fonts_dir = get_user_fonts_directory()
+    user_fonts_dir = _USER_FONTS_DIR
     fonts = []
     
     try:
-        # For the web app demo, simplify by listing fonts in the user fonts directory
-        if os.path.exists(user_fonts_dir):
-            for file in os.listdir(user_fonts_dir):
-                file_path = os.path.join(user_fonts_dir, file)
-                if os.path.isfile(file_path) and file.lower().endswith(('.ttf', '.otf', '.woff', '.woff2')):
-                    fonts.append(file_path)
+        try:
+            # DirEntry caches the file type from the directory read, saving a stat per entry
+            with os.scandir(user_fonts_dir) as entries:
+                for entry in entries:
+                    # Only the extension is lowered; is_file() is checked last
+                    # since it may need a stat on filesystems without d_type
+                    name = entry.name
+                    dot = name.rfind('.')
+                    if dot >= 0 and name[dot + 1:].lower() in _FONT_EXTS and entry.is_file():
+                        fonts.append(entry.path)
+        except FileNotFoundError:
+            # No fonts have been installed for this user yet
+            pass
         
         # For the web app demo, add some sample fonts if none are found
-        if not fonts:
-            system = platform.system()
-            if system == 'Windows':
+        if not fonts and _DEMO:
+            if _SYSTEM == 'Windows':
                 fonts = [
                     os.path.join(user_fonts_dir, 'Arial.ttf'),
                     os.path.join(user_fonts_dir, 'Times New Roman.ttf'),
                     os.path.join(user_fonts_dir, 'Calibri.ttf')
                 ]
-            elif system == 'Darwin':  # macOS
+            elif _SYSTEM == 'Darwin':  # macOS
                 fonts = [
                     os.path.join(user_fonts_dir, 'Arial.ttf'),
                     os.path.join(user_fonts_dir, 'Times New Roman.ttf'),
                     os.path.join(user_fonts_dir, 'Helvetica.ttf')
                 ]
-            elif system == 'Linux':
+            elif _SYSTEM == 'Linux':
                 fonts = [
                     os.path.join(user_fonts_dir, 'DejaVuSans.ttf'),
                     os.path.join(user_fonts_dir, 'FreeSans.ttf'),
                     os.path.join(user_fonts_dir, 'Liberation Sans.ttf')
                 ]
-    except Exception as e:
-        print(f"Error listing installed fonts: {e}")
+    except OSError as e:
+        if _VERBOSE:
+            print(f"Error listing installed fonts: {e}", file=sys.stderr)
     
     return fonts
 
-def main():
-    """Main CLI function"""
-    if len(sys.argv) < 2:
-        print(json.dumps({
-            'error': 'Missing command',
-            'usage': 'python font_manager.py [activate|deactivate|list] [font_path]'
-        }))
-        return
-    
-    command = sys.argv[1]
+def write_json(obj):
+    """Stream a compact JSON document followed by a newline to stdout"""
+    json.dump(obj, sys.stdout, separators=(',', ':'))
+    sys.stdout.write('\n')
+
+USAGE = 'python font_manager.py [activate|deactivate|list|server] [font_path ...|--batch paths_file]'
+
+def run_command(args):
+    """
+    Execute one CLI-style command
+    Args:
+        args: Command name followed by its arguments, as on the command line
+    Returns:
+        dict: JSON-serialisable response
+    """
+    command = args[0] if args else None
     
     try:
-        if command == 'activate' and len(sys.argv) >= 3:
-            font_path = sys.argv[2]
+        if command == 'activate' and len(args) >= 3 and args[1] == '--batch':
+            with open(args[2], encoding='utf-8') as f:
+                font_paths = [line.strip() for line in f if line.strip()]
+            results, errors = activate_fonts(font_paths)
+            return {'success': all(results.values()), 'results': results, 'errors': errors}
+        
+        elif command == 'activate' and len(args) > 2:
+            results, errors = activate_fonts(args[1:])
+            return {'success': all(results.values()), 'results': results, 'errors': errors}
+        
+        elif command == 'activate' and len(args) >= 2:
+            font_path = args[1]
             success = activate_font(font_path)
-            print(json.dumps({'success': success}))
+            return {'success': success}
         
-        elif command == 'deactivate' and len(sys.argv) >= 3:
-            font_path = sys.argv[2]
+        elif command == 'deactivate' and len(args) >= 2:
+            font_path = args[1]
             success = deactivate_font(font_path)
-            print(json.dumps({'success': success}))
+            return {'success': success}
         
         elif command == 'list':
             fonts = list_installed_fonts()
-            print(json.dumps({'fonts': fonts}))
+            return {'fonts': fonts}
         
         else:
-            print(json.dumps({
+            return {
                 'error': f'Unknown command: {command}',
-                'usage': 'python font_manager.py [activate|deactivate|list] [font_path]'
-            }))
+                'usage': USAGE
+            }
     
     except Exception as e:
-        print(json.dumps({'error': str(e)}))
+        return {'error': str(e)}
+
+def serve():
+    """
+    Process newline-delimited JSON commands from stdin until it is closed
+    Each request looks like {"id": 1, "command": "activate", "args": ["/path/font.ttf"]}
+    and gets a single-line response carrying the same id
+    """
+    # Requests are UTF-8 whatever the locale; Windows would otherwise decode
+    # piped stdin with the ANSI code page and garble non-ASCII font paths
+    sys.stdin.reconfigure(encoding='utf-8')
+    
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+        
+        request = None
+        try:
+            request = json.loads(line)
+            args = _parse_request(request)
+        except ValueError as e:
+            response = {'error': f'Invalid request: {e}'}
+        else:
+            response = run_command(args)
+        
+        # Echo the id even for invalid requests so the client can match them up
+        if isinstance(request, dict) and 'id' in request:
+            response['id'] = request['id']
+        
+        write_json(response)
+        sys.stdout.flush()
+
+def _parse_request(request):
+    """
+    Validate a server request and turn it into CLI-style arguments
+    Raises:
+        ValueError: If the request is malformed
+    """
+    if not isinstance(request, dict):
+        raise ValueError('request must be a JSON object')
+    
+    command = request.get('command')
+    args = request.get('args', [])
+    
+    if not isinstance(command, str):
+        raise ValueError("'command' must be a string")
+    if not isinstance(args, list) or not all(isinstance(arg, str) for arg in args):
+        raise ValueError("'args' must be a list of strings")
+    
+    return [command, *args]
+
+def main():
+    """Main CLI function"""
+    if len(sys.argv) < 2:
+        write_json({
+            'error': 'Missing command',
+            'usage': USAGE
+        })
+        return
+    
+    if sys.argv[1] == 'server':
+        serve()
+    else:
+        write_json(run_command(sys.argv[1:]))
 
 if __name__ == '__main__':
     main()
\ No newline at end of file
@@ -25,7 +25,10 @@ function runPythonScript(args) {
   return new Promise((resolve, reject) => {
     console.log(`Running Python command: python ${pythonScriptPath} ${args.join(' ')}`);
     
-    const process = spawn('python', [pythonScriptPath, ...args]);
+    // The web demo shows sample fonts when none are installed
+    const process = spawn('python', [pythonScriptPath, ...args], {
+      env: { ...globalThis.process.env, FONTMANAGER_DEMO: '1' }
+    });
     
     let stdoutData = '';
     let stderrData = '';
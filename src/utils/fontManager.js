@@ -7,11 +7,17 @@ const fs = require('fs');
 const path = require('path');
 const { spawn } = require('child_process');
 const os = require('os');
+const readline = require('readline');
 
 class FontManager {
   constructor() {
     // Path to Python script
-    this.pythonScript = path.join(__dirname, '../../python_helpers/font_manager.py');
+    this.pythonScript = this.resolvePythonScript();
+    
+    // Long-lived Python helper, started on first use
+    this.pythonServer = null;
+    this.pendingRequests = new Map();
+    this.nextRequestId = 1;
     
     // Path to active fonts cache file
     this.userDataDir = path.join(os.homedir(), '.fonter');
@@ -26,6 +32,37 @@ class FontManager {
     this.activeFonts = this.loadActiveFonts();
   }
   
+  /**
+   * Pick the Python helper to run
+   * The zipapp bundle from `npm run build:helper` is used only while it is at
+   * least as new as font_manager.py, so a stale bundle never shadows edits
+   * @returns {string} - Path to the helper script or bundle
+   */
+  resolvePythonScript() {
+    const sourceScript = path.join(__dirname, '../../python_helpers/font_manager.py');
+    const bundledScript = path.join(__dirname, '../../python_helpers/fontmgr.pyz');
+    
+    try {
+      const bundleTime = fs.statSync(bundledScript).mtimeMs;
+      let sourceTime = 0;
+      try {
+        sourceTime = fs.statSync(sourceScript).mtimeMs;
+      } catch (error) {
+        // Packaged builds may ship only the bundle
+      }
+      
+      if (bundleTime >= sourceTime) {
+        return bundledScript;
+      }
+      
+      console.log('Ignoring fontmgr.pyz: font_manager.py is newer');
+    } catch (error) {
+      // No bundle has been built
+    }
+    
+    return sourceScript;
+  }
+  
   /**
    * Load active fonts from cache file
    */
@@ -53,55 +90,93 @@ class FontManager {
   }
   
   /**
-   * Execute Python helper script with arguments
+   * Start the long-lived Python helper in server mode
+   * Commands are exchanged as newline-delimited JSON so the interpreter
+   * only starts once for the lifetime of the app
+   * @returns {ChildProcess} - The running helper process
+   */
+  startPythonServer() {
+    if (this.pythonServer) {
+      return this.pythonServer;
+    }
+    
+    console.log(`Starting Python server: python ${this.pythonScript} server`);
+    
+    const server = spawn('python', [this.pythonScript, 'server']);
+    this.pythonServer = server;
+    
+    // Route each response line to the request with the matching id
+    readline.createInterface({ input: server.stdout }).on('line', (line) => {
+      let result;
+      try {
+        result = JSON.parse(line);
+      } catch (error) {
+        console.error('Failed to parse Python server output:', error);
+        console.error('Raw output:', line);
+        return;
+      }
+      
+      const pending = this.pendingRequests.get(result.id);
+      if (!pending) {
+        console.error('Unexpected Python server response:', line);
+        return;
+      }
+      
+      this.pendingRequests.delete(result.id);
+      delete result.id;
+      pending.resolve(result);
+    });
+    
+    server.stderr.on('data', (data) => {
+      console.error(`Python error: ${data.toString()}`);
+    });
+    
+    // Fail outstanding requests and let the next call restart the server
+    const shutdown = (error) => {
+      if (this.pythonServer !== server) {
+        return;
+      }
+      
+      this.pythonServer = null;
+      for (const pending of this.pendingRequests.values()) {
+        pending.reject(error);
+      }
+      this.pendingRequests.clear();
+    };
+    
+    server.on('close', (code) => {
+      console.error(`Python server exited with code ${code}`);
+      shutdown(new Error(`Python server exited with code ${code}`));
+    });
+    
+    server.on('error', (error) => {
+      console.error('Failed to start Python server:', error);
+      shutdown(error);
+    });
+    
+    // Writing to a helper that has died (or never started) raises EPIPE here;
+    // without a listener Node would treat it as an uncaught error
+    server.stdin.on('error', (error) => {
+      console.error('Failed to write to Python server:', error);
+      shutdown(error);
+    });
+    
+    return server;
+  }
+  
+  /**
+   * Execute a Python helper command with arguments
    * @param {Array} args - Command line arguments to pass to Python script
    * @returns {Promise<Object>} - Script output as parsed JSON
    */
   runPythonScript(args) {
     return new Promise((resolve, reject) => {
-      console.log(`Running Python command: python ${this.pythonScript} ${args.join(' ')}`);
-      
-      const process = spawn('python', [this.pythonScript, ...args]);
-      
-      let stdoutData = '';
-      let stderrData = '';
-      
-      // Collect stdout data
-      process.stdout.on('data', (data) => {
-        stdoutData += data.toString();
-      });
-      
-      // Collect stderr data
-      process.stderr.on('data', (data) => {
-        stderrData += data.toString();
-        console.error(`Python error: ${data.toString()}`);
-      });
-      
-      // Handle process completion
-      process.on('close', (code) => {
-        if (code !== 0) {
-          console.error(`Python script exited with code ${code}`);
-          console.error(`Error output: ${stderrData}`);
-          reject(new Error(`Python script exited with code ${code}: ${stderrData}`));
-          return;
-        }
-        
-        try {
-          // Try to parse the output as JSON
-          const result = JSON.parse(stdoutData);
-          resolve(result);
-        } catch (error) {
-          console.error('Failed to parse Python script output:', error);
-          console.error('Raw output:', stdoutData);
-          reject(error);
-        }
-      });
+      const server = this.startPythonServer();
+      const id = this.nextRequestId++;
+      const [command, ...commandArgs] = args;
       
-      // Handle process errors
-      process.on('error', (error) => {
-        console.error('Failed to start Python script:', error);
-        reject(error);
-      });
+      this.pendingRequests.set(id, { resolve, reject });
+      server.stdin.write(JSON.stringify({ id, command, args: commandArgs }) + '\n');
     });
   }
   